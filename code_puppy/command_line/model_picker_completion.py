@@ -1,4 +1,8 @@
 import os
+import pickle
+import threading
+import time
+from bisect import bisect_left
 from typing import Iterable, Optional
 
 from prompt_toolkit import PromptSession
@@ -6,15 +10,131 @@ from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 from prompt_toolkit.history import FileHistory
 
-from code_puppy.config import get_global_model_name
+from code_puppy.config import CACHE_DIR, get_global_model_name
 from code_puppy.model_factory import ModelFactory
 from code_puppy.model_switching import set_model_and_reload_agent
 
+# Model-name cache so completion (which runs on every keystroke) doesn't
+# re-parse the models config each time. Entries older than _MODELS_TTL
+# seconds are reloaded on the next access. "by_lower" maps lowercased
+# names back to their canonical form for O(1) exact-match lookups.
+_MODELS_CACHE: dict = {"ts": 0.0, "data": None, "by_lower": None}
+_MODELS_TTL = 30.0
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_IN_FLIGHT = False
+
+# Last-known-good snapshot on disk, used when the live config can't be
+# loaded at all (endpoint down on a cold start). Session state already
+# uses pickle (see session_storage), so the same format is used here.
+_MODELS_SNAPSHOT_FILE = os.path.join(CACHE_DIR, "model_names.pkl")
+
+
+def _write_models_snapshot(names: list) -> None:
+    """Best-effort write of the model names to the disk snapshot."""
+    try:
+        with open(_MODELS_SNAPSHOT_FILE, "wb") as f:
+            pickle.dump(names, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+
+
+def _read_models_snapshot() -> Optional[list]:
+    """Read the disk snapshot; None if missing or unreadable."""
+    try:
+        with open(_MODELS_SNAPSHOT_FILE, "rb") as f:
+            names = pickle.load(f)
+    except Exception:
+        return None
+    return names if isinstance(names, list) else None
+
+
+def _store_model_names(names: list) -> None:
+    """Store freshly loaded model names in the in-memory cache."""
+    global _completer_singleton
+    if names != _MODELS_CACHE["data"]:
+        # Name list changed - the completer's sorted index is stale too
+        _completer_singleton = None
+        _write_models_snapshot(names)
+    _MODELS_CACHE["data"] = names
+    _MODELS_CACHE["by_lower"] = {name.lower(): name for name in names}
+    _MODELS_CACHE["ts"] = time.monotonic()
+
+
+def _refresh_model_cache() -> None:
+    """Reload the model config and replace the cache; on failure keep
+    serving the stale data rather than surfacing an error mid-prompt."""
+    global _REFRESH_IN_FLIGHT
+    try:
+        names = list(ModelFactory.load_config().keys())
+    except Exception:
+        pass
+    else:
+        _store_model_names(names)
+    finally:
+        with _REFRESH_LOCK:
+            _REFRESH_IN_FLIGHT = False
+
+
+def _warm_model_cache() -> None:
+    """Background warm-up of the model-name cache; failures stay silent
+    here and surface deterministically when /model is actually used."""
+    try:
+        load_model_names()
+    except Exception:
+        pass
+
+
+def refresh_models() -> None:
+    """Invalidate the cached model names so the next access reloads them."""
+    global _completer_singleton
+    _MODELS_CACHE["data"] = None
+    _MODELS_CACHE["by_lower"] = None
+    _MODELS_CACHE["ts"] = 0.0
+    _completer_singleton = None
+    _session_cache.clear()
+
 
 def load_model_names():
-    """Load model names from the config that's fetched from the endpoint."""
-    models_config = ModelFactory.load_config()
-    return list(models_config.keys())
+    """Load model names from the config that's fetched from the endpoint.
+
+    Results are cached for _MODELS_TTL seconds. Once past the TTL the stale
+    list is served immediately and a daemon thread revalidates in the
+    background, so a slow (or dead) endpoint never blocks the prompt.
+    Call refresh_models() to force a synchronous reload.
+    """
+    global _REFRESH_IN_FLIGHT
+    data = _MODELS_CACHE["data"]
+    if data is None:
+        # Cold cache - nothing to serve, load synchronously
+        try:
+            names = list(ModelFactory.load_config().keys())
+        except Exception:
+            # Config unavailable - fall back to the last-known-good disk
+            # snapshot rather than failing the prompt; the TTL will retry
+            # the live load shortly.
+            names = _read_models_snapshot()
+            if names is None:
+                raise
+        _store_model_names(names)
+        data = _MODELS_CACHE["data"]
+    elif time.monotonic() - _MODELS_CACHE["ts"] > _MODELS_TTL:
+        # Stale - serve what we have and revalidate off the hot path
+        with _REFRESH_LOCK:
+            spawn = not _REFRESH_IN_FLIGHT
+            _REFRESH_IN_FLIGHT = True
+        if spawn:
+            threading.Thread(target=_refresh_model_cache, daemon=True).start()
+    return data
+
+
+def _models_by_lower() -> dict:
+    """Return the cached lowercase-name -> canonical-name mapping."""
+    names = load_model_names()
+    if _MODELS_CACHE["data"] is names and _MODELS_CACHE["by_lower"] is not None:
+        return _MODELS_CACHE["by_lower"]
+    # load_model_names was overridden (e.g. patched in tests) or the cache
+    # was invalidated underneath us - build the mapping from what it returned
+    return {name.lower(): name for name in names}
 
 
 def get_active_model():
@@ -32,6 +152,11 @@ def set_active_model(model_name: str):
     set_model_and_reload_agent(model_name)
 
 
+# Completion metadata indexed by "is this the active model", so the
+# per-candidate loop does one indexed load instead of branching
+_META_TABLE = ("Model", "Model (selected)")
+
+
 class ModelNameCompleter(Completer):
     """
     A completer that triggers on '/model' to show available models from models.json.
@@ -40,47 +165,96 @@ class ModelNameCompleter(Completer):
 
     def __init__(self, trigger: str = "/model"):
         self.trigger = trigger
-        self.model_names = load_model_names()
+        self._trigger_prefix = trigger + " "
+        # Index built lazily on the first completion request so that
+        # constructing the completer (and the prompt session holding it)
+        # never blocks on a cold model load.
+        self.model_names = None
+        self._pairs = None
+        self._sorted_pairs = None
+        self._sorted_keys = None
+
+    def _ensure_index(self) -> None:
+        """Build the completion index, rebuilding it if the names changed.
+
+        The cache hands out the same list object until a reload replaces
+        it, so one identity check per completion request is enough to keep
+        a long-lived completer (sessions cache this object) in sync with
+        background revalidation. The index is (lowercase, canonical) pairs
+        in config order for the unfiltered dropdown, plus a sorted copy so
+        prefix filtering can use a bisect range instead of scanning every
+        name per keystroke.
+        """
+        names = load_model_names()
+        if names is self.model_names:
+            return
+        self.model_names = names
+        self._pairs = [(name.lower(), name) for name in names]
+        self._sorted_pairs = sorted(self._pairs)
+        self._sorted_keys = [lower for lower, _ in self._sorted_pairs]
 
     def get_completions(
         self, document: Document, complete_event
     ) -> Iterable[Completion]:
-        text = document.text
-        cursor_position = document.cursor_position
-        text_before_cursor = text[:cursor_position]
-
-        # Only trigger if /model is at the very beginning of the line and has a space after it
-        stripped_text = text_before_cursor.lstrip()
-        if not stripped_text.startswith(self.trigger + " "):
+        # This runs on every keystroke, so bail out as cheaply as possible
+        # for non-trigger input before touching any other state.
+        text_before_cursor = document.text_before_cursor
+
+        # Only trigger if /model is at the very beginning of the line
+        # (leading whitespace allowed) and has a space after it
+        start = (
+            len(text_before_cursor) - len(text_before_cursor.lstrip())
+            if text_before_cursor[:1].isspace()
+            else 0
+        )
+        if not text_before_cursor.startswith(self._trigger_prefix, start):
+            return
+        self._ensure_index()
+        if not self.model_names:
             return
 
-        # Find where /model actually starts (after any leading whitespace)
-        symbol_pos = text_before_cursor.find(self.trigger)
         text_after_trigger = text_before_cursor[
-            symbol_pos + len(self.trigger) + 1 :
+            start + len(self._trigger_prefix) :
         ].lstrip()
         start_position = -(len(text_after_trigger))
 
-        # Filter model names based on what's typed after /model (case-insensitive)
-        for model_name in self.model_names:
-            if text_after_trigger and not model_name.lower().startswith(
-                text_after_trigger.lower()
-            ):
-                continue  # Skip models that don't match the typed text
-
-            meta = (
-                "Model (selected)"
-                if model_name.lower() == get_active_model().lower()
-                else "Model"
-            )
+        # Invariant across the loop - fetch once rather than per model
+        active_lower = get_active_model().lower()
+        typed_lower = text_after_trigger.lower()
+
+        # Filter model names based on what's typed after /model
+        # (case-insensitive). Prefix matches form a contiguous range in the
+        # sorted index, so a bisect pair replaces the linear startswith scan.
+        if typed_lower:
+            lo = bisect_left(self._sorted_keys, typed_lower)
+            hi = bisect_left(self._sorted_keys, typed_lower + "\uffff")
+            candidates = self._sorted_pairs[lo:hi]
+        else:
+            candidates = self._pairs
+
+        for model_lower, model_name in candidates:
             yield Completion(
                 model_name,
                 start_position=start_position,
                 display=model_name,
-                display_meta=meta,
+                display_meta=_META_TABLE[model_lower == active_lower],
             )
 
 
+# Reused across prompt invocations so the model index isn't rebuilt on
+# every prompt; refresh_models() drops it along with the name cache.
+_completer_singleton: Optional[ModelNameCompleter] = None
+
+
+def _get_completer(trigger: str) -> ModelNameCompleter:
+    """Return the shared ModelNameCompleter, rebuilding it if the trigger
+    differs or the cache has been invalidated."""
+    global _completer_singleton
+    if _completer_singleton is None or _completer_singleton.trigger != trigger:
+        _completer_singleton = ModelNameCompleter(trigger)
+    return _completer_singleton
+
+
 def _find_matching_model(rest: str, model_names: list[str]) -> Optional[str]:
     """
     Find the best matching model for the given input.
@@ -116,80 +290,79 @@ def _find_matching_model(rest: str, model_names: list[str]) -> Optional[str]:
     return None
 
 
+# Aliases that switch the model when they lead the input. Both behave
+# identically, so update_model_in_input handles them with one code path;
+# adding a new alias is a one-line change here.
+_MODEL_PREFIXES = ("/model ", "/m ")
+
+
 def update_model_in_input(text: str) -> Optional[str]:
     # If input starts with /model or /m and a model name, set model and strip it out
     content = text.strip()
-    model_names = load_model_names()
-
-    # Check for /model command (require space after /model, case-insensitive)
-    if content.lower().startswith("/model "):
-        # Find the actual /model command (case-insensitive)
-        model_cmd = content.split(" ", 1)[0]  # Get the command part
-        rest = content[len(model_cmd) :].strip()  # Remove the actual command
-
-        # Find the best matching model
-        model = _find_matching_model(rest, model_names)
-        if model:
-            # Found a matching model - now extract it properly
-            set_active_model(model)
-
-            # Find the actual model name in the original text (preserving case)
-            # We need to find where the model ends in the original rest string
-            model_end_idx = len(model)
-
-            # Build the full command+model part to remove
-            cmd_and_model_pattern = model_cmd + " " + rest[:model_end_idx]
-            idx = text.find(cmd_and_model_pattern)
-            if idx != -1:
-                new_text = (
-                    text[:idx] + text[idx + len(cmd_and_model_pattern) :]
-                ).strip()
-                return new_text
-            return None
-
-    # Check for /m command (case-insensitive)
-    elif content.lower().startswith("/m ") and not content.lower().startswith(
-        "/model "
-    ):
-        # Find the actual /m command (case-insensitive)
-        m_cmd = content.split(" ", 1)[0]  # Get the command part
-        rest = content[len(m_cmd) :].strip()  # Remove the actual command
-
-        # Find the best matching model
-        model = _find_matching_model(rest, model_names)
-        if model:
-            # Found a matching model - now extract it properly
-            set_active_model(model)
-
-            # Find the actual model name in the original text (preserving case)
-            # We need to find where the model ends in the original rest string
-            model_end_idx = len(model)
-
-            # Build the full command+model part to remove
-            # Handle space variations in the original text
-            cmd_and_model_pattern = m_cmd + " " + rest[:model_end_idx]
-            idx = text.find(cmd_and_model_pattern)
-            if idx != -1:
-                new_text = (
-                    text[:idx] + text[idx + len(cmd_and_model_pattern) :]
-                ).strip()
-                return new_text
-            return None
+    content_lower = content.lower()
+
+    # The overwhelmingly common case is ordinary chat input - bail out on
+    # the prefix checks before touching the model-name cache at all
+    if not content_lower.startswith(_MODEL_PREFIXES):
+        return None
+
+    # Extract the command as actually typed (case-insensitive match above)
+    model_cmd = content.split(" ", 1)[0]  # Get the command part
+    rest = content[len(model_cmd) :].strip()  # Remove the actual command
+
+    # Find the best matching model - O(1) exact match first, then the
+    # linear prefix/word scan for partial input
+    model = _models_by_lower().get(rest.lower()) or _find_matching_model(
+        rest, load_model_names()
+    )
+    if not model:
+        return None
+
+    # Found a matching model - now extract it properly
+    set_active_model(model)
+
+    # Find the actual model name in the original text (preserving case)
+    # We need to find where the model ends in the original rest string
+    model_end_idx = len(model)
 
+    # Build the full command+model part to remove
+    cmd_and_model_pattern = model_cmd + " " + rest[:model_end_idx]
+    idx = text.find(cmd_and_model_pattern)
+    if idx != -1:
+        return (text[:idx] + text[idx + len(cmd_and_model_pattern) :]).strip()
     return None
 
 
+# PromptSession construction builds a key-binding registry and FileHistory
+# probes the history file on disk - neither changes between prompts, so
+# sessions are cached per (trigger, history_file) and reused. refresh_models()
+# clears this alongside the other caches.
+_session_cache: dict = {}
+
+
 async def get_input_with_model_completion(
     prompt_str: str = ">>> ",
     trigger: str = "/model",
     history_file: Optional[str] = None,
 ) -> str:
-    history = FileHistory(os.path.expanduser(history_file)) if history_file else None
-    session = PromptSession(
-        completer=ModelNameCompleter(trigger),
-        history=history,
-        complete_while_typing=True,
-    )
+    # Warm the model-name cache off the prompt path: on a cold start this
+    # finishes while the user is still typing, so the dropdown is instant
+    # the first time they reach for /model. load_model_names is cached, so
+    # the thread is a no-op when the cache is already warm.
+    if _MODELS_CACHE["data"] is None:
+        threading.Thread(target=_warm_model_cache, daemon=True).start()
+
+    session = _session_cache.get((trigger, history_file))
+    if session is None:
+        history = (
+            FileHistory(os.path.expanduser(history_file)) if history_file else None
+        )
+        session = PromptSession(
+            completer=_get_completer(trigger),
+            history=history,
+            complete_while_typing=True,
+        )
+        _session_cache[(trigger, history_file)] = session
     text = await session.prompt_async(prompt_str)
     possibly_stripped = update_model_in_input(text)
     if possibly_stripped is not None:
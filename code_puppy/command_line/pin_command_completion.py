@@ -4,14 +4,34 @@ from typing import Iterable
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
+# Lazily-imported modules, memoized on first use. The helpers below run
+# once per completion item on every keystroke, so re-executing the
+# `from ... import ...` machinery there adds up; functions are resolved
+# with a plain attribute access at call time instead.
+_config = None
+_json_agent = None
+_agent_manager = None
+
+
+def _bind_lazy_imports() -> None:
+    global _config, _json_agent, _agent_manager
+    if _config is None:
+        import code_puppy.agents.agent_manager as _agent_manager_mod
+        import code_puppy.agents.json_agent as _json_agent_mod
+        import code_puppy.config as _config_mod
+
+        _config = _config_mod
+        _json_agent = _json_agent_mod
+        _agent_manager = _agent_manager_mod
+
 
 def _get_json_agents_for_model(model_name: str) -> list:
     """Get JSON agents that have this model pinned in their JSON file."""
     try:
-        from code_puppy.agents.json_agent import discover_json_agents
+        _bind_lazy_imports()
 
         pinned = []
-        json_agents = discover_json_agents()
+        json_agents = _json_agent.discover_json_agents()
         for agent_name, agent_path in json_agents.items():
             try:
                 with open(agent_path, "r") as f:
@@ -29,9 +49,9 @@ def _get_pinned_model_for_agent(agent_name: str) -> str | None:
     """Get the pinned model for an agent (config or JSON)."""
     # Check config first (for built-in agents)
     try:
-        from code_puppy.config import get_agent_pinned_model
+        _bind_lazy_imports()
 
-        pinned = get_agent_pinned_model(agent_name)
+        pinned = _config.get_agent_pinned_model(agent_name)
         if pinned:
             return pinned
     except Exception:
@@ -39,9 +59,7 @@ def _get_pinned_model_for_agent(agent_name: str) -> str | None:
 
     # Check if it's a JSON agent with a model key
     try:
-        from code_puppy.agents.json_agent import discover_json_agents
-
-        json_agents = discover_json_agents()
+        json_agents = _json_agent.discover_json_agents()
         if agent_name in json_agents:
             with open(json_agents[agent_name], "r") as f:
                 agent_data = json.load(f)
@@ -55,9 +73,9 @@ def _get_pinned_model_for_agent(agent_name: str) -> str | None:
 def _get_model_display_meta(model_name: str) -> str:
     """Get display meta for a model showing pinned agents."""
     try:
-        from code_puppy.config import get_agents_pinned_to_model
+        _bind_lazy_imports()
 
-        pinned_agents = get_agents_pinned_to_model(model_name)
+        pinned_agents = _config.get_agents_pinned_to_model(model_name)
         pinned_agents.extend(_get_json_agents_for_model(model_name))
         pinned_agents = list(set(pinned_agents))  # Deduplicate
 
@@ -85,18 +103,18 @@ def load_agent_names():
 
     # Get built-in agents
     try:
-        from code_puppy.agents.agent_manager import get_agent_descriptions
+        _bind_lazy_imports()
 
-        builtin_agents = get_agent_descriptions()
+        builtin_agents = _agent_manager.get_agent_descriptions()
         agents.update(builtin_agents.keys())
     except Exception:
         pass
 
     # Get JSON agents
     try:
-        from code_puppy.agents.json_agent import discover_json_agents
+        _bind_lazy_imports()
 
-        json_agents = discover_json_agents()
+        json_agents = _json_agent.discover_json_agents()
         agents.update(json_agents.keys())
     except Exception:
         pass
@@ -6,6 +6,24 @@ from typing import Optional
 
 from code_puppy.config import set_model_name
 
+# Lazily-imported modules, memoized on first use. These can't be imported
+# at module load time (circular dependencies), but re-running the
+# `from ... import ...` machinery on every model switch is wasted work, so
+# the module objects are cached in module-level sentinels and functions are
+# resolved with a plain attribute access at call time.
+_messaging = None
+_agents = None
+
+
+def _bind_lazy_imports() -> None:
+    global _messaging, _agents
+    if _messaging is None:
+        import code_puppy.agents as _agents_mod
+        import code_puppy.messaging as _messaging_mod
+
+        _messaging = _messaging_mod
+        _agents = _agents_mod
+
 
 def _get_effective_agent_model(agent) -> Optional[str]:
     """Safely fetch the effective model name for an agent."""
@@ -25,16 +43,16 @@ def set_model_and_reload_agent(
     This keeps model switching consistent across commands while avoiding
     direct imports that can trigger circular dependencies.
     """
-    from code_puppy.messaging import emit_info, emit_warning
+    _bind_lazy_imports()
 
     set_model_name(model_name)
 
     try:
-        from code_puppy.agents import get_current_agent
-
-        current_agent = get_current_agent()
+        current_agent = _agents.get_current_agent()
         if current_agent is None:
-            emit_warning("Model changed but no active agent was found to reload")
+            _messaging.emit_warning(
+                "Model changed but no active agent was found to reload"
+            )
             return
 
         # JSON agents may need to refresh their config before reload
@@ -51,13 +69,13 @@ def set_model_and_reload_agent(
                 display_name = getattr(
                     current_agent, "display_name", current_agent.name
                 )
-                emit_warning(
+                _messaging.emit_warning(
                     "Active agent "
                     f"'{display_name}' is pinned to '{effective_model}', "
                     f"so '{model_name}' will not take effect until unpinned."
                 )
 
         current_agent.reload_code_generation_agent()
-        emit_info("Active agent reloaded")
+        _messaging.emit_info("Active agent reloaded")
     except Exception as exc:
-        emit_warning(f"Model changed but agent reload failed: {exc}")
+        _messaging.emit_warning(f"Model changed but agent reload failed: {exc}")
@@ -2,6 +2,7 @@ import asyncio
 import fnmatch
 import hashlib
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -436,8 +437,29 @@ FILE_IGNORE_PATTERNS = [
 IGNORE_PATTERNS = DIR_IGNORE_PATTERNS + FILE_IGNORE_PATTERNS
 
 
+def _compile_ignore_regex(patterns) -> re.Pattern:
+    """Combine fnmatch patterns into one alternation regex.
+
+    fnmatch.translate() anchors each branch with \\Z, so a single match()
+    against the combined pattern answers "does any pattern fully match"
+    in one pass instead of one fnmatch call per pattern.
+    """
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+# Precompiled fast paths for the ignore checks below. A hit on these is
+# definitive; a miss falls back to the per-pattern loop, which also covers
+# pathlib-style and path-component matching that fnmatch alone does not.
+_IGNORE_RE = _compile_ignore_regex(IGNORE_PATTERNS)
+_DIR_IGNORE_RE = _compile_ignore_regex(DIR_IGNORE_PATTERNS)
+
+
 def should_ignore_path(path: str) -> bool:
     """Return True if *path* matches any pattern in IGNORE_PATTERNS."""
+    # Fast path: one combined-regex pass catches plain fnmatch hits
+    if _IGNORE_RE.match(path):
+        return True
+
     # Convert path to Path object for better pattern matching
     path_obj = Path(path)
 
@@ -472,6 +494,10 @@ def should_ignore_path(path: str) -> bool:
 
 def should_ignore_dir_path(path: str) -> bool:
     """Return True if path matches any directory ignore pattern (directories only)."""
+    # Fast path: one combined-regex pass catches plain fnmatch hits
+    if _DIR_IGNORE_RE.match(path):
+        return True
+
     path_obj = Path(path)
     for pattern in DIR_IGNORE_PATTERNS:
         try:
@@ -879,7 +905,7 @@ async def arrow_select_async(
                 lines.append("")
 
         lines.append(
-            "<ansicyan>(Use ↑↓ or Ctrl+P/N to select, Enter to confirm)</ansicyan>"
+            "<ansicyan>(Use ↑↓ or Ctrl+P/N to select, Enter to confirm, 1-9 to pick directly)</ansicyan>"
         )
         return HTML("\n".join(lines))
 
@@ -903,6 +929,15 @@ async def arrow_select_async(
         result[0] = choices[selected_index[0]]
         event.app.exit()
 
+    # Digit shortcuts: a single keypress selects and confirms, skipping
+    # the arrow-then-enter round trip for short lists
+    for digit in range(1, min(len(choices), 9) + 1):
+
+        @kb.add(str(digit))
+        def pick_by_digit(event, index=digit - 1):
+            result[0] = choices[index]
+            event.app.exit()
+
     @kb.add("c-c")  # Ctrl-C
     def cancel(event):
         result[0] = None
@@ -959,7 +994,7 @@ def arrow_select(message: str, choices: list[str]) -> str:
                 lines.append(f"  {choice}")
         lines.append("")
         lines.append(
-            "<ansicyan>(Use ↑↓ or Ctrl+P/N to select, Enter to confirm)</ansicyan>"
+            "<ansicyan>(Use ↑↓ or Ctrl+P/N to select, Enter to confirm, 1-9 to pick directly)</ansicyan>"
         )
         return HTML("\n".join(lines))
 
@@ -983,6 +1018,15 @@ def arrow_select(message: str, choices: list[str]) -> str:
         result[0] = choices[selected_index[0]]
         event.app.exit()
 
+    # Digit shortcuts: a single keypress selects and confirms, skipping
+    # the arrow-then-enter round trip for short lists
+    for digit in range(1, min(len(choices), 9) + 1):
+
+        @kb.add(str(digit))
+        def pick_by_digit(event, index=digit - 1):
+            result[0] = choices[index]
+            event.app.exit()
+
     @kb.add("c-c")  # Ctrl-C
     def cancel(event):
         result[0] = None
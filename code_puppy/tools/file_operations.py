@@ -1,10 +1,14 @@
 # file_operations.py
 
+import json
 import os
+import shlex
 import shutil
+import stat
 import subprocess
+import sys
 import tempfile
-from typing import List
+from typing import List, NamedTuple
 
 from pydantic import BaseModel, conint
 from pydantic_ai import RunContext
@@ -20,15 +24,24 @@ from code_puppy.messaging import (  # New structured messaging types
     GrepResultMessage,
     get_message_bus,
 )
+from code_puppy.tools.common import DIR_IGNORE_PATTERNS
 
+# The grep ignore file is the same every call - build its content once
+_GREP_IGNORE_CONTENT = "".join(f"{pattern}\n" for pattern in DIR_IGNORE_PATTERNS)
 
-# Pydantic models for tool return types
-class ListedFile(BaseModel):
+
+# Internal accumulation record for list_files. A NamedTuple rather than a
+# pydantic model: one is created per listed path and never validated or
+# serialized, so skipping per-field validation keeps large listings cheap.
+class ListedFile(NamedTuple):
     path: str | None
     type: str | None
     size: int = 0
-    full_path: str | None
-    depth: int | None
+    full_path: str | None = None
+    depth: int | None = None
+
+
+# Pydantic models for tool return types
 
 
 class ListFileOutput(BaseModel):
@@ -151,8 +164,6 @@ def would_match_directory(pattern: str, directory: str) -> bool:
 def _list_files(
     context: RunContext, directory: str = ".", recursive: bool = True
 ) -> ListFileOutput:
-    import sys
-
     results = []
     directory = os.path.abspath(os.path.expanduser(directory))
 
@@ -203,10 +214,6 @@ def _list_files(
             cmd = [rg_path, "--files"]
 
             # Add ignore patterns to the command via a temporary file
-            from code_puppy.tools.common import (
-                DIR_IGNORE_PATTERNS,
-            )
-
             f = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".ignore")
             ignore_file = f.name
             try:
@@ -228,82 +235,72 @@ def _list_files(
             # Process the output lines
             files = result.stdout.strip().split("\n") if result.stdout.strip() else []
 
-            # Create ListedFile objects with metadata
+            # Create ListedFile objects with metadata. A single os.stat per
+            # entry answers existence, kind, and size at once instead of the
+            # separate exists/isfile/getsize calls (4 stat syscalls each).
+            seen_dirs: set[str] = set()
             for full_path in files:
                 if not full_path:  # Skip empty lines
                     continue
 
-                # Skip if file doesn't exist (though it should)
-                if not os.path.exists(full_path):
+                try:
+                    stat_info = os.stat(full_path)
+                except (FileNotFoundError, PermissionError, OSError):
+                    # Skip files that vanished or that we can't access
                     continue
 
-                # Extract relative path from the full path
-                if full_path.startswith(directory):
-                    file_path = full_path[len(directory) :].lstrip(os.sep)
-                else:
-                    file_path = full_path
-
-                # Check if path is a file or directory
-                if os.path.isfile(full_path):
+                if stat.S_ISREG(stat_info.st_mode):
                     entry_type = "file"
-                    size = os.path.getsize(full_path)
-                elif os.path.isdir(full_path):
+                    size = stat_info.st_size
+                elif stat.S_ISDIR(stat_info.st_mode):
                     entry_type = "directory"
                     size = 0
                 else:
                     # Skip if it's neither a file nor directory
                     continue
 
-                try:
-                    # Get stats for the entry
-                    stat_info = os.stat(full_path)
-                    actual_size = stat_info.st_size
-
-                    # For files, we use the actual size; for directories, we keep size=0
-                    if entry_type == "file":
-                        size = actual_size
-
-                    # Calculate depth based on the relative path
-                    depth = file_path.count(os.sep)
-
-                    # Add directory entries if needed for files
-                    if entry_type == "file":
-                        dir_path = os.path.dirname(file_path)
-                        if dir_path:
-                            # Add directory path components if they don't exist
-                            path_parts = dir_path.split(os.sep)
-                            for i in range(len(path_parts)):
-                                partial_path = os.sep.join(path_parts[: i + 1])
-                                # Check if we already added this directory
-                                if not any(
-                                    f.path == partial_path and f.type == "directory"
-                                    for f in results
-                                ):
-                                    results.append(
-                                        ListedFile(
-                                            path=partial_path,
-                                            type="directory",
-                                            size=0,
-                                            full_path=os.path.join(
-                                                directory, partial_path
-                                            ),
-                                            depth=partial_path.count(os.sep),
-                                        )
-                                    )
+                # Extract relative path from the full path
+                if full_path.startswith(directory):
+                    file_path = full_path[len(directory) :].lstrip(os.sep)
+                else:
+                    file_path = full_path
 
-                    # Add the entry (file or directory)
-                    results.append(
-                        ListedFile(
-                            path=file_path,
-                            type=entry_type,
-                            size=size,
-                            full_path=full_path,
-                            depth=depth,
-                        )
+                # Calculate depth based on the relative path
+                depth = file_path.count(os.sep)
+
+                # Add directory entries if needed for files
+                if entry_type == "file":
+                    dir_path = os.path.dirname(file_path)
+                    if dir_path:
+                        # Add directory path components if they don't exist
+                        path_parts = dir_path.split(os.sep)
+                        for i in range(len(path_parts)):
+                            partial_path = os.sep.join(path_parts[: i + 1])
+                            # Check if we already added this directory
+                            if partial_path not in seen_dirs:
+                                seen_dirs.add(partial_path)
+                                results.append(
+                                    ListedFile(
+                                        path=partial_path,
+                                        type="directory",
+                                        size=0,
+                                        full_path=os.path.join(directory, partial_path),
+                                        depth=partial_path.count(os.sep),
+                                    )
+                                )
+                else:
+                    seen_dirs.add(file_path)
+
+                # Add the entry (file or directory)
+                results.append(
+                    ListedFile(
+                        path=file_path,
+                        type=entry_type,
+                        size=size,
+                        full_path=full_path,
+                        depth=depth,
                     )
-                except (FileNotFoundError, PermissionError, OSError):
-                    # Skip files we can't access
-                    continue
+                )
 
         # In non-recursive mode, we also need to explicitly list immediate entries
         # ripgrep's --files option only returns files; we add directories and files ourselves
@@ -497,20 +494,12 @@ def _read_file(
                 # Read the entire file
                 content = f.read()
 
-            # Sanitize the content to remove any surrogate characters that could
-            # cause issues when the content is later serialized or displayed
-            # This re-encodes with surrogatepass then decodes with replace to
-            # convert lone surrogates to replacement characters
-            try:
-                content = content.encode("utf-8", errors="surrogatepass").decode(
-                    "utf-8", errors="replace"
-                )
-            except (UnicodeEncodeError, UnicodeDecodeError):
-                # If that fails, do a more aggressive cleanup
-                content = "".join(
-                    char if ord(char) < 0xD800 or ord(char) > 0xDFFF else "\ufffd"
-                    for char in content
-                )
+            # Sanitize the content to remove any surrogate characters that
+            # could cause issues when the content is later serialized or
+            # displayed. _sanitize_string checks cleanliness with a single
+            # C-level encode first, so well-formed files (the common case)
+            # skip the re-encode/decode round trip entirely.
+            content = _sanitize_string(content)
 
             # Simple approximation: ~4 characters per token
             num_tokens = len(content) // 4
@@ -584,13 +573,6 @@ def _sanitize_string(text: str) -> str:
 
 
 def _grep(context: RunContext, search_string: str, directory: str = ".") -> GrepOutput:
-    import json
-    import os
-    import shlex
-    import shutil
-    import subprocess
-    import sys
-
     # Sanitize search string to handle any surrogates from copy-paste
     search_string = _sanitize_string(search_string)
 
@@ -639,13 +621,10 @@ def _grep(context: RunContext, search_string: str, directory: str = ".") -> Grep
         ]
 
         # Add ignore patterns to the command via a temporary file
-        from code_puppy.tools.common import DIR_IGNORE_PATTERNS
-
         f = tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".ignore")
         ignore_file = f.name
         try:
-            for pattern in DIR_IGNORE_PATTERNS:
-                f.write(f"{pattern}\n")
+            f.write(_GREP_IGNORE_CONTENT)
         finally:
             f.close()
 
@@ -677,24 +656,19 @@ def _grep(context: RunContext, search_string: str, directory: str = ".") -> Grep
                 # Only process match events, not context or summary
                 if match_data.get("type") == "match":
                     data = match_data.get("data", {})
-                    path_data = data.get("path", {})
-                    file_path = (
-                        path_data.get("text", "") if path_data.get("text") else ""
-                    )
+                    file_path = data.get("path", {}).get("text") or ""
                     line_number = data.get("line_number", None)
-                    line_content = (
-                        data.get("lines", {}).get("text", "")
-                        if data.get("lines", {}).get("text")
-                        else ""
-                    )
-                    if len(line_content.strip()) > 512:
-                        line_content = line_content.strip()[0:512]
+                    # Strip once up front rather than per use below
+                    line_content = (data.get("lines", {}).get("text") or "").strip()
+                    if len(line_content) > 512:
+                        line_content = line_content[0:512]
                     if file_path and line_number:
-                        # Sanitize content to handle any remaining encoding issues
+                        # stdout was decoded with errors="replace", so the
+                        # strings are already clean - no per-match sanitize
                         match_info = MatchInfo(
-                            file_path=_sanitize_string(file_path),
+                            file_path=file_path,
                             line_number=line_number,
-                            line_content=_sanitize_string(line_content.strip()),
+                            line_content=line_content,
                         )
                         matches.append(match_info)
                         # Limit to 50 matches total, same as original implementation
@@ -18,6 +18,121 @@ class TestLoadModelNames:
             assert "gpt-4" in result
             assert "claude-3" in result
 
+    def test_results_are_cached(self):
+        from code_puppy.command_line.model_picker_completion import load_model_names
+
+        with patch(
+            "code_puppy.model_factory.ModelFactory.load_config",
+            return_value={"gpt-4": {}},
+        ) as mock_load:
+            load_model_names()
+            load_model_names()
+            mock_load.assert_called_once()
+
+    def test_refresh_models_invalidates_cache(self):
+        from code_puppy.command_line.model_picker_completion import (
+            load_model_names,
+            refresh_models,
+        )
+
+        with patch(
+            "code_puppy.model_factory.ModelFactory.load_config",
+            return_value={"gpt-4": {}},
+        ):
+            assert load_model_names() == ["gpt-4"]
+        refresh_models()
+        with patch(
+            "code_puppy.model_factory.ModelFactory.load_config",
+            return_value={"claude-3": {}},
+        ):
+            assert load_model_names() == ["claude-3"]
+
+    def test_stale_cache_served_while_revalidating(self):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        with patch(
+            "code_puppy.model_factory.ModelFactory.load_config",
+            return_value={"old-model": {}},
+        ):
+            assert mpc.load_model_names() == ["old-model"]
+
+        # Age the cache past the TTL, then make the refresh thread run
+        # synchronously so the test is deterministic
+        mpc._MODELS_CACHE["ts"] -= mpc._MODELS_TTL + 1
+
+        class _SyncThread:
+            def __init__(self, target=None, daemon=None):
+                self._target = target
+
+            def start(self):
+                self._target()
+
+        with (
+            patch.object(mpc.threading, "Thread", _SyncThread),
+            patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                return_value={"new-model": {}},
+            ),
+        ):
+            # The stale list is served immediately...
+            assert mpc.load_model_names() == ["old-model"]
+        # ...and the background refresh has replaced it for the next call
+        assert mpc.load_model_names() == ["new-model"]
+
+    def test_load_failure_falls_back_to_snapshot(self, tmp_path):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        snapshot = str(tmp_path / "model_names.pkl")
+        with patch.object(mpc, "_MODELS_SNAPSHOT_FILE", snapshot):
+            mpc._write_models_snapshot(["snapshot-model"])
+            with patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                side_effect=Exception("endpoint down"),
+            ):
+                assert mpc.load_model_names() == ["snapshot-model"]
+
+    def test_load_failure_without_snapshot_raises(self, tmp_path):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        snapshot = str(tmp_path / "missing.pkl")
+        with (
+            patch.object(mpc, "_MODELS_SNAPSHOT_FILE", snapshot),
+            patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                side_effect=Exception("endpoint down"),
+            ),
+            pytest.raises(Exception, match="endpoint down"),
+        ):
+            mpc.load_model_names()
+
+    def test_successful_load_overwrites_snapshot(self, tmp_path):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        snapshot = str(tmp_path / "model_names.pkl")
+        with patch.object(mpc, "_MODELS_SNAPSHOT_FILE", snapshot):
+            mpc._write_models_snapshot(["stale-model"])
+            with patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                return_value={"fresh-model": {}},
+            ):
+                assert mpc.load_model_names() == ["fresh-model"]
+            assert mpc._read_models_snapshot() == ["fresh-model"]
+
+    def test_unreadable_snapshot_is_ignored(self, tmp_path):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        snapshot = tmp_path / "model_names.pkl"
+        snapshot.write_bytes(b"not a pickle")
+        with (
+            patch.object(mpc, "_MODELS_SNAPSHOT_FILE", str(snapshot)),
+            patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                side_effect=Exception("endpoint down"),
+            ),
+            pytest.raises(Exception, match="endpoint down"),
+        ):
+            mpc.load_model_names()
+
 
 class TestGetActiveModel:
     def test_returns_model_name(self):
@@ -97,6 +212,33 @@ class TestModelNameCompleter:
             assert len(completions) == 1
             assert completions[0].text == "claude-3"
 
+    def test_reflects_refreshed_model_list(self):
+        from code_puppy.command_line import model_picker_completion as mpc
+
+        with (
+            patch(
+                "code_puppy.model_factory.ModelFactory.load_config",
+                return_value={"old-model": {}},
+            ),
+            patch(
+                "code_puppy.command_line.model_picker_completion.get_active_model",
+                return_value="old-model",
+            ),
+        ):
+            c = mpc.ModelNameCompleter(trigger="/model")
+            completions = list(c.get_completions(self._make_doc("/model "), None))
+            assert [x.text for x in completions] == ["old-model"]
+
+        # A background revalidation replaces the cached list; the same
+        # completer instance (sessions hold onto it) must pick that up
+        mpc._store_model_names(["new-model"])
+        with patch(
+            "code_puppy.command_line.model_picker_completion.get_active_model",
+            return_value="old-model",
+        ):
+            completions = list(c.get_completions(self._make_doc("/model "), None))
+            assert [x.text for x in completions] == ["new-model"]
+
 
 class TestFindMatchingModel:
     def test_exact_match(self):
@@ -68,12 +68,22 @@ def isolate_config_between_tests(tmp_path_factory):
     cp_config.clear_model_cache()
     # Clear session-local model cache (required for /model session sticky behavior)
     cp_config.reset_session_model()
+    # Clear the cached model-name list so per-test load_config patches take effect
+    from code_puppy.command_line import model_picker_completion as mpc
+
+    mpc.refresh_models()
+
+    # Redirect the model-name disk snapshot too - tests that patch
+    # load_config must not overwrite the user's real offline fallback
+    original_snapshot_file = mpc._MODELS_SNAPSHOT_FILE
+    mpc._MODELS_SNAPSHOT_FILE = os.path.join(config_temp_dir, "model_names.pkl")
 
     yield
 
     # Restore original config paths
     cp_config.CONFIG_FILE = original_config_file
     cp_config.CONFIG_DIR = original_config_dir
+    mpc._MODELS_SNAPSHOT_FILE = original_snapshot_file
 
     # Clear cache again after test
     cp_config.clear_model_cache()